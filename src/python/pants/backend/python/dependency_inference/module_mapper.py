@@ -7,7 +7,7 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import PurePath
-from typing import DefaultDict
+from typing import DefaultDict, Iterable
 
 from packaging.utils import canonicalize_name as canonicalize_project_name
 
@@ -25,6 +25,7 @@ from pants.engine.target import SourcesPathsRequest, Targets
 from pants.engine.unions import UnionMembership, UnionRule, union
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.meta import frozen_after_init
 
 logger = logging.getLogger(__name__)
 
@@ -335,18 +336,13 @@ class PythonModuleOwners:
             )
 
 
-@rule
-async def map_module_to_address(
-    module: PythonModule,
+def _owners_for_module(
+    module: str,
     first_party_mapping: FirstPartyPythonModuleMapping,
     third_party_mapping: ThirdPartyPythonModuleMapping,
 ) -> PythonModuleOwners:
-    third_party_addresses, third_party_ambiguous = third_party_mapping.addresses_for_module(
-        module.module
-    )
-    first_party_addresses, first_party_ambiguous = first_party_mapping.addresses_for_module(
-        module.module
-    )
+    third_party_addresses, third_party_ambiguous = third_party_mapping.addresses_for_module(module)
+    first_party_addresses, first_party_ambiguous = first_party_mapping.addresses_for_module(module)
 
     # First, check if there was any ambiguity within the first-party or third-party mappings. Note
     # that even if there's ambiguity purely within either third-party or first-party, all targets
@@ -384,6 +380,50 @@ async def map_module_to_address(
     return PythonModuleOwners(())
 
 
+@rule
+async def map_module_to_address(
+    module: PythonModule,
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModuleOwners:
+    return _owners_for_module(module.module, first_party_mapping, third_party_mapping)
+
+
+@frozen_after_init
+@dataclass(unsafe_hash=True)
+class PythonModulesRequest:
+    """Find the owners of several Python modules at once.
+
+    If you have multiple modules, you'll get better performance with this than with a `MultiGet`
+    of `PythonModule`, as the module mappings are only consulted by a single rule.
+    """
+
+    modules: tuple[str, ...]
+
+    def __init__(self, modules: Iterable[str]) -> None:
+        # Deduplicate and sort, so that repeated modules share one lookup and for more cache hits.
+        self.modules = tuple(sorted(set(modules)))
+
+
+@dataclass(frozen=True)
+class PythonModulesOwners:
+    owners: FrozenDict[str, PythonModuleOwners]
+
+
+@rule
+async def map_modules_to_addresses(
+    request: PythonModulesRequest,
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModulesOwners:
+    return PythonModulesOwners(
+        FrozenDict(
+            (module, _owners_for_module(module, first_party_mapping, third_party_mapping))
+            for module in request.modules
+        )
+    )
+
+
 def rules():
     return (
         *collect_rules(),
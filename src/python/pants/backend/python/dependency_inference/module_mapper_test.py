@@ -19,6 +19,8 @@ from pants.backend.python.dependency_inference.module_mapper import (
     FirstPartyPythonModuleMapping,
     PythonModule,
     PythonModuleOwners,
+    PythonModulesOwners,
+    PythonModulesRequest,
     ThirdPartyPythonModuleMapping,
 )
 from pants.backend.python.dependency_inference.module_mapper import rules as module_mapper_rules
@@ -169,6 +171,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(FirstPartyPythonModuleMapping, []),
             QueryRule(ThirdPartyPythonModuleMapping, []),
             QueryRule(PythonModuleOwners, [PythonModule]),
+            QueryRule(PythonModulesOwners, [PythonModulesRequest]),
         ],
         target_types=[PythonLibrary, PythonRequirementLibrary, ProtobufLibrary],
     )
@@ -567,3 +570,33 @@ def test_map_module_to_address(rule_runner: RuleRunner) -> None:
             ),
         ],
     )
+
+
+def test_map_modules_to_addresses(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(["--source-root-patterns=['root']"])
+    rule_runner.write_files(
+        {
+            "root/project/app.py": "",
+            "root/project/util.py": "",
+            "root/project/BUILD": "python_library()",
+            "BUILD": "python_requirement_library(name='req', requirements=['colors'])",
+        }
+    )
+    request = PythonModulesRequest(["project.util", "colors", "project.app", "colors", "typing"])
+    # Repeated modules are only looked up once.
+    assert request.modules == ("colors", "project.app", "project.util", "typing")
+    result = rule_runner.request(PythonModulesOwners, [request])
+    assert result == PythonModulesOwners(
+        FrozenDict(
+            {
+                "colors": PythonModuleOwners((Address("", target_name="req"),)),
+                "project.app": PythonModuleOwners(
+                    (Address("root/project", relative_file_path="app.py"),)
+                ),
+                "project.util": PythonModuleOwners(
+                    (Address("root/project", relative_file_path="util.py"),)
+                ),
+                "typing": PythonModuleOwners(()),
+            }
+        )
+    )
@@ -24,6 +24,7 @@ from pants.backend.python.subsystems.pytest import PyTest
 from pants.core.goals.package import OutputPathField
 from pants.core.goals.test import RuntimePackageDependenciesField
 from pants.engine.addresses import Address, Addresses
+from pants.engine.collection import Collection
 from pants.engine.target import (
     COMMON_TARGET_FIELDS,
     AsyncFieldMixin,
@@ -238,6 +239,20 @@ class ResolvePexEntryPointRequest:
     entry_point_field: PexEntryPointField
 
 
+# See `target_types_rules.py` for the `ResolvePexEntryPointsBatchRequest -> ResolvedPexEntryPoints`
+# rule.
+class ResolvedPexEntryPoints(Collection[ResolvedPexEntryPoint]):
+    """The resolved entry points, in the same order as the requests they were resolved from."""
+
+
+class ResolvePexEntryPointsBatchRequest(Collection[ResolvePexEntryPointRequest]):
+    """Determine the `entry_point` for several `pex_binary` targets at once.
+
+    Prefer this to a `MultiGet` of `ResolvePexEntryPointRequest` when resolving many entry points,
+    as all file names are validated with a single `PathGlobs` request.
+    """
+
+
 class PexPlatformsField(StringSequenceField):
     alias = "platforms"
     help = (
@@ -10,11 +10,16 @@ defined in `target_types.py`.
 import dataclasses
 import logging
 import os.path
-from collections import defaultdict
+from pathlib import PurePath
 from textwrap import dedent
-from typing import DefaultDict, Dict, Generator, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, cast
 
-from pants.backend.python.dependency_inference.module_mapper import PythonModule, PythonModuleOwners
+from pants.backend.python.dependency_inference.module_mapper import (
+    PythonModule,
+    PythonModuleOwners,
+    PythonModulesOwners,
+    PythonModulesRequest,
+)
 from pants.backend.python.dependency_inference.rules import PythonInferSubsystem, import_rules
 from pants.backend.python.goals.setup_py import InvalidEntryPoint
 from pants.backend.python.target_types import (
@@ -26,29 +31,30 @@ from pants.backend.python.target_types import (
     PythonDistributionEntryPointsField,
     PythonProvidesField,
     ResolvedPexEntryPoint,
+    ResolvedPexEntryPoints,
     ResolvedPythonDistributionEntryPoints,
     ResolvePexEntryPointRequest,
+    ResolvePexEntryPointsBatchRequest,
     ResolvePythonDistributionEntryPointsRequest,
 )
-from pants.engine.addresses import Address, Addresses, UnparsedAddressInputs
-from pants.engine.fs import GlobMatchErrorBehavior, PathGlobs, Paths
+from pants.engine.addresses import Address, Addresses, AddressInput, UnparsedAddressInputs
+from pants.engine.fs import PathGlobs, Paths
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import (
-    Dependencies,
     DependenciesRequest,
     ExplicitlyProvidedDependencies,
     InjectDependenciesRequest,
     InjectedDependencies,
     InvalidFieldException,
-    Targets,
+    UnexpandedTargets,
     WrappedTarget,
 )
 from pants.engine.unions import UnionRule
-from pants.source.source_root import SourceRoot, SourceRootRequest
+from pants.source.filespec import matches_filespec
+from pants.source.source_root import SourceRootsRequest, SourceRootsResult
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
-from pants.util.ordered_set import OrderedSet
 
 logger = logging.getLogger(__name__)
 
@@ -57,58 +63,114 @@ logger = logging.getLogger(__name__)
 # -----------------------------------------------------------------------------------------------
 
 
-@rule(desc="Determining the entry point for a `pex_binary` target", level=LogLevel.DEBUG)
-async def resolve_pex_entry_point(request: ResolvePexEntryPointRequest) -> ResolvedPexEntryPoint:
-    ep_val = request.entry_point_field.value
-    address = request.entry_point_field.address
+# We support several different schemes:
+#  1) `<none>` or `<None>` => set to `None`.
+#  2) `path.to.module` => preserve exactly.
+#  3) `path.to.module:func` => preserve exactly.
+#  4) `app.py` => convert into `path.to.app`.
+#  5) `app.py:func` => convert into `path.to.app:func`.
 
-    # We support several different schemes:
-    #  1) `<none>` or `<None>` => set to `None`.
-    #  2) `path.to.module` => preserve exactly.
-    #  3) `path.to.module:func` => preserve exactly.
-    #  4) `app.py` => convert into `path.to.app`.
-    #  5) `app.py:func` => convert into `path.to.app:func`.
 
+def _maybe_quick_resolve_entry_point(ep_val: EntryPoint) -> Optional[ResolvedPexEntryPoint]:
+    """Resolve the entry point without the engine, unless it uses a file name.
+
+    Returns None for file names (cases #4 and #5), which must be resolved by the engine.
+    """
     # Case #1.
     if ep_val.module in ("<none>", "<None>"):
         return ResolvedPexEntryPoint(None, file_name_used=False)
-
-    # If it's already a module (cases #2 and #3), simply use that. Otherwise, convert the file name
-    # into a module path (cases #4 and #5).
+    # If it's already a module (cases #2 and #3), simply use that. Otherwise, the file name must be
+    # converted into a module path (cases #4 and #5).
     if not ep_val.module.endswith(".py"):
         return ResolvedPexEntryPoint(ep_val, file_name_used=False)
-
-    # Use the engine to validate that the file exists and that it resolves to only one file.
-    full_glob = os.path.join(address.spec_path, ep_val.module)
-    entry_point_paths = await Get(
-        Paths,
-        PathGlobs(
-            [full_glob],
-            glob_match_error_behavior=GlobMatchErrorBehavior.error,
-            description_of_origin=f"{address}'s `{request.entry_point_field.alias}` field",
-        ),
-    )
-    # We will have already raised if the glob did not match, i.e. if there were no files. But
-    # we need to check if they used a file glob (`*` or `**`) that resolved to >1 file.
-    if len(entry_point_paths.files) != 1:
-        raise InvalidFieldException(
-            f"Multiple files matched for the `{request.entry_point_field.alias}` "
-            f"{ep_val.spec!r} for the target {address}, but only one file expected. Are you using "
-            f"a glob, rather than a file name?\n\n"
-            f"All matching files: {list(entry_point_paths.files)}."
-        )
-    entry_point_path = entry_point_paths.files[0]
-    source_root = await Get(
-        SourceRoot,
-        SourceRootRequest,
-        SourceRootRequest.for_file(entry_point_path),
+    return None
+
+
+@rule(desc="Determining the entry points for `pex_binary` targets", level=LogLevel.DEBUG)
+async def resolve_pex_entry_points(
+    request: ResolvePexEntryPointsBatchRequest,
+) -> ResolvedPexEntryPoints:
+    resolved: List[Optional[ResolvedPexEntryPoint]] = [None] * len(request)
+    # The index into `resolved`, the glob, and the original request for each file name used.
+    file_name_requests: List[Tuple[int, str, ResolvePexEntryPointRequest]] = []
+    for i, ep_request in enumerate(request):
+        ep_val = ep_request.entry_point_field.value
+        quick_resolved = _maybe_quick_resolve_entry_point(ep_val)
+        if quick_resolved is not None:
+            resolved[i] = quick_resolved
+        else:
+            # The spec_path is already normalized, so we can avoid the overhead of `os.path.join`.
+            spec_path = ep_request.entry_point_field.address.spec_path
+            full_glob = f"{spec_path}/{ep_val.module}" if spec_path else ep_val.module
+            file_name_requests.append((i, full_glob, ep_request))
+
+    if not file_name_requests:
+        return ResolvedPexEntryPoints(cast(List[ResolvedPexEntryPoint], resolved))
+
+    # Expand all of the globs with a single request. We validate the matches for each entry point
+    # below, rather than having the engine error, so that the error names the offending target.
+    all_entry_point_paths = await Get(
+        Paths, PathGlobs(full_glob for _, full_glob, _ in file_name_requests)
     )
-    stripped_source_path = os.path.relpath(entry_point_path, source_root.path)
-    module_base, _ = os.path.splitext(stripped_source_path)
-    normalized_path = module_base.replace(os.path.sep, ".")
-    return ResolvedPexEntryPoint(
-        dataclasses.replace(ep_val, module=normalized_path), file_name_used=True
+    all_entry_point_files = set(all_entry_point_paths.files)
+
+    entry_point_paths_by_index: Dict[int, str] = {}
+    for i, full_glob, ep_request in file_name_requests:
+        # Most entry points are plain file names, which we can look up directly. Only real globs
+        # need to be matched against the expanded paths.
+        if any(c in full_glob for c in "*?["):
+            entry_point_paths = matches_filespec(
+                {"includes": [full_glob]}, paths=all_entry_point_paths.files
+            )
+        else:
+            # NB: The engine normalizes globs before matching them, e.g. dropping `./`, so we must
+            # do the same for the lookup to find the expanded path.
+            entry_point_path = os.path.normpath(full_glob)
+            entry_point_paths = (
+                (entry_point_path,) if entry_point_path in all_entry_point_files else ()
+            )
+        if not entry_point_paths:
+            raise InvalidFieldException(
+                f"Unmatched glob from {ep_request.entry_point_field.address}'s "
+                f"`{ep_request.entry_point_field.alias}` field: {full_glob!r}"
+            )
+        # We need to check if they used a file glob (`*` or `**`) that resolved to >1 file.
+        if len(entry_point_paths) != 1:
+            raise InvalidFieldException(
+                f"Multiple files matched for the `{ep_request.entry_point_field.alias}` "
+                f"{ep_request.entry_point_field.value.spec!r} for the target "
+                f"{ep_request.entry_point_field.address}, but only one file expected. Are you "
+                f"using a glob, rather than a file name?\n\n"
+                f"All matching files: {list(entry_point_paths)}."
+            )
+        entry_point_paths_by_index[i] = entry_point_paths[0]
+
+    # Entry points often share a source root, so we look them all up at once to only resolve each
+    # directory a single time.
+    source_roots = await Get(
+        SourceRootsResult,
+        SourceRootsRequest,
+        SourceRootsRequest.for_files(entry_point_paths_by_index.values()),
     )
+    for i, entry_point_path in entry_point_paths_by_index.items():
+        ep_val = request[i].entry_point_field.value
+        source_root = source_roots.path_to_root[PurePath(entry_point_path)]
+        stripped_source_path = os.path.relpath(entry_point_path, source_root.path)
+        # We already know that the file ends in `.py`, so we can strip it directly.
+        normalized_path = stripped_source_path[:-3].replace(os.path.sep, ".")
+        resolved[i] = ResolvedPexEntryPoint(
+            dataclasses.replace(ep_val, module=normalized_path), file_name_used=True
+        )
+    return ResolvedPexEntryPoints(cast(List[ResolvedPexEntryPoint], resolved))
+
+
+@rule
+async def resolve_pex_entry_point(request: ResolvePexEntryPointRequest) -> ResolvedPexEntryPoint:
+    quick_resolved = _maybe_quick_resolve_entry_point(request.entry_point_field.value)
+    if quick_resolved is not None:
+        return quick_resolved
+    resolved = await Get(ResolvedPexEntryPoints, ResolvePexEntryPointsBatchRequest([request]))
+    return resolved[0]
 
 
 class InjectPexBinaryEntryPointDependency(InjectDependenciesRequest):
@@ -122,17 +184,18 @@ async def inject_pex_binary_entry_point_dependency(
     if not python_infer_subsystem.entry_points:
         return InjectedDependencies()
     original_tgt = await Get(WrappedTarget, Address, request.dependencies_field.address)
+    entry_point_field = original_tgt.target[PexEntryPointField]
     explicitly_provided_deps, entry_point = await MultiGet(
-        Get(ExplicitlyProvidedDependencies, DependenciesRequest(original_tgt.target[Dependencies])),
-        Get(
-            ResolvedPexEntryPoint,
-            ResolvePexEntryPointRequest(original_tgt.target[PexEntryPointField]),
-        ),
+        Get(ExplicitlyProvidedDependencies, DependenciesRequest(request.dependencies_field)),
+        Get(ResolvedPexEntryPoint, ResolvePexEntryPointRequest(entry_point_field)),
     )
     if entry_point.val is None:
         return InjectedDependencies()
     owners = await Get(PythonModuleOwners, PythonModule(entry_point.val.module))
-    address = original_tgt.target.address
+    # In the common case where there is no ambiguity, we can skip building the warning context.
+    if not owners.ambiguous:
+        return InjectedDependencies(owners.unambiguous)
+    address = request.dependencies_field.address
     explicitly_provided_deps.maybe_warn_of_ambiguous_dependency_inference(
         owners.ambiguous,
         address,
@@ -142,17 +205,14 @@ async def inject_pex_binary_entry_point_dependency(
         import_reference="module",
         context=(
             f"The pex_binary target {address} has the field "
-            f"`entry_point={repr(original_tgt.target[PexEntryPointField].value.spec)}`, which "
+            f"`entry_point={repr(entry_point_field.value.spec)}`, which "
             f"maps to the Python module `{entry_point.val.module}`"
         ),
     )
     maybe_disambiguated = explicitly_provided_deps.disambiguated(
         owners.ambiguous, owners_must_be_ancestors=entry_point.file_name_used
     )
-    unambiguous_owners = owners.unambiguous or (
-        (maybe_disambiguated,) if maybe_disambiguated else ()
-    )
-    return InjectedDependencies(unambiguous_owners)
+    return InjectedDependencies((maybe_disambiguated,) if maybe_disambiguated else ())
 
 
 # -----------------------------------------------------------------------------------------------
@@ -160,21 +220,22 @@ async def inject_pex_binary_entry_point_dependency(
 # -----------------------------------------------------------------------------------------------
 
 
-def _classify_entry_points(
-    all_entry_points: FrozenDict[str, FrozenDict[str, str]]
-) -> Generator[Tuple[bool, str, str, str], None, None]:
-    """Looks at each entry point to see if it is a target address or not.
-
-    Yields tuples: is_target, category, name, entry_point_str.
-    """
-    for category, entry_points in all_entry_points.items():
-        for name, entry_point_str in entry_points.items():
-            yield (
-                entry_point_str.startswith(":") or "/" in entry_point_str,
-                category,
-                name,
-                entry_point_str,
+def _validate_script_entry_point(
+    address: Address, category: str, name: str, entry_point: EntryPoint
+) -> None:
+    """Validate that console and GUI script entry points have a function."""
+    if category in ["console_scripts", "gui_scripts"] and not entry_point.function:
+        url = "https://python-packaging.readthedocs.io/en/latest/command-line-scripts.html#the-console-scripts-entry-point"
+        raise InvalidEntryPoint(
+            dedent(
+                f"""\
+            Every entry point in `{category}` for {address} must end in the format `:my_func`,
+            but {name} set it to {entry_point.spec!r}. For example, set
+            `entry_points={{"{category}": {{"{name}": "{entry_point.module}:main}} }}`.
+            See {url}.
+            """
             )
+        )
 
 
 @rule(desc="Determining the entry points for a `python_distribution` target", level=LogLevel.DEBUG)
@@ -186,25 +247,31 @@ async def resolve_python_distribution_entry_points(
         return ResolvedPythonDistributionEntryPoints()
 
     address = request.entry_points_field.address
-    classified_entry_points = list(_classify_entry_points(field_value))
 
-    # Pick out all target addresses up front, so we can use MultiGet later.
+    # Look at each entry point to see if it is a target address or a module. We pick out all
+    # target refs up front, in order, so that they can be resolved in one batch, and remember the
+    # classification of every entry point so that we only do it once.
+    target_refs: List[str] = []
+    is_target_ref: List[bool] = []
+    for category_entry_points in field_value.values():
+        for entry_point_str in category_entry_points.values():
+            # NB: Comparing the first character is cheaper than calling `str.startswith`.
+            is_target = entry_point_str[:1] == ":" or "/" in entry_point_str
+            is_target_ref.append(is_target)
+            if is_target:
+                target_refs.append(entry_point_str)
+
+    # Resolve all target addresses up front, so we can use MultiGet later.
     #
-    # This calls for a bit of trickery however (using the "y_by_x" mapping dicts), so we keep track
-    # of which address belongs to which entry point. I.e. the `address_by_ref` and
-    # `binary_entry_point_by_address` variables.
-
-    target_refs = [
-        entry_point_str for is_target, _, _, entry_point_str in classified_entry_points if is_target
-    ]
-
-    # Intermediate step, as Get(Targets) returns a deduplicated set.. which breaks in case of
-    # mulitple input refs that maps to the same target.
+    # NB: We use `UnexpandedTargets` rather than `Targets`, as the latter is deduplicated, which
+    # breaks in case of multiple input refs that map to the same target. This way, the addresses,
+    # targets, and resolved entry points all line up with `target_refs` by position, and so with
+    # the order in which we visit the target refs below.
     target_addresses = await Get(
-        Addresses, UnparsedAddressInputs(target_refs, owning_address=address)
+        Addresses,
+        UnparsedAddressInputs(target_refs, owning_address=address),
     )
-    address_by_ref = dict(zip(target_refs, target_addresses))
-    targets = await Get(Targets, Addresses, target_addresses)
+    targets = await Get(UnexpandedTargets, Addresses, target_addresses)
 
     # Check that we only have targets with a pex entry_point field.
     for target in targets:
@@ -217,55 +284,44 @@ async def resolve_python_distribution_entry_points(
                 f"See {doc_url('python-distributions')}."
             )
 
-    binary_entry_points = await MultiGet(
-        Get(
-            ResolvedPexEntryPoint,
-            ResolvePexEntryPointRequest(target[PexEntryPointField]),
-        )
-        for target in targets
+    binary_entry_points = await Get(
+        ResolvedPexEntryPoints,
+        ResolvePexEntryPointsBatchRequest(
+            ResolvePexEntryPointRequest(target[PexEntryPointField]) for target in targets
+        ),
     )
-    binary_entry_point_by_address = {
-        target.address: entry_point for target, entry_point in zip(targets, binary_entry_points)
-    }
-
-    entry_points: DefaultDict[str, Dict[str, PythonDistributionEntryPoint]] = defaultdict(dict)
-
-    # Parse refs/replace with resolved pex entry point, and validate console entry points have function.
-    for is_target, category, name, ref in classified_entry_points:
-        owner: Optional[Address] = None
-        if is_target:
-            owner = address_by_ref[ref]
-            entry_point = binary_entry_point_by_address[owner].val
-            if entry_point is None:
-                logger.warning(
-                    f"The entry point {name} in {category} references a pex binary {ref}, "
-                    "which has set its entry point to '<none>'. "
-                    "Skipping this entry because '<none>' is not valid as an entry point."
-                )
-                continue
-        else:
-            entry_point = EntryPoint.parse(ref, f"{name} for {address} {category}")
-
-        if category in ["console_scripts", "gui_scripts"] and not entry_point.function:
-            url = "https://python-packaging.readthedocs.io/en/latest/command-line-scripts.html#the-console-scripts-entry-point"
-            raise InvalidEntryPoint(
-                dedent(
-                    f"""\
-                Every entry point in `{category}` for {address} must end in the format `:my_func`,
-                but {name} set it to {entry_point.spec!r}. For example, set
-                `entry_points={{"{category}": {{"{name}": "{entry_point.module}:main}} }}`.
-                See {url}.
-                """
-                )
-            )
 
-        entry_points[category][name] = PythonDistributionEntryPoint(entry_point, owner)
-
-    return ResolvedPythonDistributionEntryPoints(
-        FrozenDict(
-            {category: FrozenDict(entry_points) for category, entry_points in entry_points.items()}
-        )
-    )
+    resolved_target_refs = iter(zip(target_addresses, binary_entry_points))
+    is_target_ref_iter = iter(is_target_ref)
+
+    entry_points: Dict[str, FrozenDict[str, PythonDistributionEntryPoint]] = {}
+
+    # Parse refs/replace with resolved pex entry point, and validate console entry points have a
+    # function. Each category's `FrozenDict` is built in the same pass, rather than in a second
+    # pass over the results.
+    for category, category_entry_points in field_value.items():
+        resolved_category_entry_points: Dict[str, PythonDistributionEntryPoint] = {}
+        for name, ref in category_entry_points.items():
+            owner: Optional[Address] = None
+            if next(is_target_ref_iter):
+                owner, resolved_binary_entry_point = next(resolved_target_refs)
+                entry_point = resolved_binary_entry_point.val
+                if entry_point is None:
+                    logger.warning(
+                        f"The entry point {name} in {category} references a pex binary {ref}, "
+                        "which has set its entry point to '<none>'. "
+                        "Skipping this entry because '<none>' is not valid as an entry point."
+                    )
+                    continue
+            else:
+                entry_point = EntryPoint.parse(ref, f"{name} for {address} {category}")
+            _validate_script_entry_point(address, category, name, entry_point)
+            resolved_category_entry_points[name] = PythonDistributionEntryPoint(entry_point, owner)
+        # Skip categories where every entry point was skipped.
+        if resolved_category_entry_points:
+            entry_points[category] = FrozenDict(resolved_category_entry_points)
+
+    return ResolvedPythonDistributionEntryPoints(FrozenDict(entry_points))
 
 
 class InjectPythonDistributionDependencies(InjectDependenciesRequest):
@@ -279,10 +335,9 @@ async def inject_python_distribution_dependencies(
     """Inject dependencies that we can infer from entry points in the distribution."""
     if not python_infer_subsystem.entry_points:
         return InjectedDependencies()
-
     original_tgt = await Get(WrappedTarget, Address, request.dependencies_field.address)
     explicitly_provided_deps, all_entry_points = await MultiGet(
-        Get(ExplicitlyProvidedDependencies, DependenciesRequest(original_tgt.target[Dependencies])),
+        Get(ExplicitlyProvidedDependencies, DependenciesRequest(request.dependencies_field)),
         Get(
             ResolvedPythonDistributionEntryPoints,
             ResolvePythonDistributionEntryPointsRequest(
@@ -291,52 +346,64 @@ async def inject_python_distribution_dependencies(
         ),
     )
 
-    address = original_tgt.target.address
-    all_module_entry_points = [
-        (category, name, entry_point)
-        for category, entry_points in all_entry_points.explicit_modules.items()
-        for name, entry_point in entry_points.items()
-    ]
-    all_module_owners = iter(
-        await MultiGet(
-            Get(PythonModuleOwners, PythonModule(entry_point.module))
-            for _, _, entry_point in all_module_entry_points
-        )
+    address = request.dependencies_field.address
+    explicit_modules = all_entry_points.explicit_modules
+    all_module_owners = await Get(
+        PythonModulesOwners,
+        PythonModulesRequest(
+            entry_point.module
+            for entry_points in explicit_modules.values()
+            for entry_point in entry_points.values()
+        ),
     )
-    module_owners: OrderedSet[Address] = OrderedSet()
-    for (category, name, entry_point), owners in zip(all_module_entry_points, all_module_owners):
-        field_str = repr({category: {name: entry_point.spec}})
-        explicitly_provided_deps.maybe_warn_of_ambiguous_dependency_inference(
-            owners.ambiguous,
-            address,
-            import_reference="module",
-            context=(
-                f"The python_distribution target {address} has the field "
-                f"`entry_points={field_str}`, which maps to the Python module"
-                f"`{entry_point.module}`"
-            ),
-        )
-        maybe_disambiguated = explicitly_provided_deps.disambiguated(owners.ambiguous)
-        unambiguous_owners = owners.unambiguous or (
-            (maybe_disambiguated,) if maybe_disambiguated else ()
-        )
-        module_owners.update(unambiguous_owners)
-
-    with_binaries = original_tgt.target[PythonProvidesField].value.binaries
-    if not with_binaries:
-        with_binaries_addresses = Addresses()
-    else:
-        # Note that we don't validate that these are all `pex_binary` targets; we don't care about
-        # that here. `setup_py.py` will do that validation.
-        with_binaries_addresses = await Get(
-            Addresses,
-            UnparsedAddressInputs(
-                with_binaries.values(), owning_address=request.dependencies_field.address
-            ),
+    # NB: We use a dict rather than an `OrderedSet` for cheaper insertion-ordered deduplication.
+    module_owners: Dict[Address, None] = {}
+    for category, entry_points in explicit_modules.items():
+        for name, entry_point in entry_points.items():
+            owners = all_module_owners.owners[entry_point.module]
+            # In the common case where there is no ambiguity, we can skip building the warning
+            # context.
+            if not owners.ambiguous:
+                for owner in owners.unambiguous:
+                    module_owners[owner] = None
+                continue
+            field_str = repr({category: {name: entry_point.spec}})
+            explicitly_provided_deps.maybe_warn_of_ambiguous_dependency_inference(
+                owners.ambiguous,
+                address,
+                import_reference="module",
+                context=(
+                    f"The python_distribution target {address} has the field "
+                    f"`entry_points={field_str}`, which maps to the Python module"
+                    f"`{entry_point.module}`"
+                ),
+            )
+            maybe_disambiguated = explicitly_provided_deps.disambiguated(owners.ambiguous)
+            if maybe_disambiguated:
+                module_owners[maybe_disambiguated] = None
+
+    # Note that we don't validate that these are all `pex_binary` targets; we don't care about
+    # that here. `setup_py.py` will do that validation.
+    #
+    # Addresses of targets in the same directory can be resolved without the engine, as we know
+    # that directory exists. Only the other addresses need to be checked on disk.
+    with_binaries_addresses: List[Address] = []
+    unresolved_with_binaries: List[str] = []
+    for with_binary in original_tgt.target[PythonProvidesField].value.binaries.values():
+        if with_binary.startswith(":"):
+            address_input = AddressInput.parse(with_binary, relative_to=address.spec_path)
+            with_binaries_addresses.append(address_input.dir_to_address())
+        else:
+            unresolved_with_binaries.append(with_binary)
+    if unresolved_with_binaries:
+        with_binaries_addresses.extend(
+            await Get(
+                Addresses, UnparsedAddressInputs(unresolved_with_binaries, owning_address=address)
+            )
         )
 
     return InjectedDependencies(
-        Addresses(module_owners) + with_binaries_addresses + all_entry_points.pex_binary_addresses
+        (*module_owners, *with_binaries_addresses, *all_entry_points.pex_binary_addresses)
     )
 
 
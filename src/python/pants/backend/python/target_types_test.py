@@ -31,7 +31,9 @@ from pants.backend.python.target_types import (
     PythonRequirementsField,
     PythonTestsTimeout,
     ResolvedPexEntryPoint,
+    ResolvedPexEntryPoints,
     ResolvePexEntryPointRequest,
+    ResolvePexEntryPointsBatchRequest,
     TypeStubsModuleMappingField,
     parse_requirements_file,
 )
@@ -41,6 +43,7 @@ from pants.backend.python.target_types_rules import (
     inject_pex_binary_entry_point_dependency,
     inject_python_distribution_dependencies,
     resolve_pex_entry_point,
+    resolve_pex_entry_points,
     resolve_python_distribution_entry_points,
 )
 from pants.backend.python.util_rules import python_sources
@@ -130,6 +133,7 @@ def test_resolve_pex_binary_entry_point() -> None:
     rule_runner = RuleRunner(
         rules=[
             resolve_pex_entry_point,
+            resolve_pex_entry_points,
             QueryRule(ResolvedPexEntryPoint, [ResolvePexEntryPointRequest]),
         ]
     )
@@ -176,11 +180,86 @@ def test_resolve_pex_binary_entry_point() -> None:
         assert_resolved(entry_point="*.py", expected=EntryPoint("doesnt matter"), is_file=True)
 
 
+def test_resolve_pex_binary_entry_points_batch() -> None:
+    rule_runner = RuleRunner(
+        rules=[
+            resolve_pex_entry_points,
+            QueryRule(ResolvedPexEntryPoints, [ResolvePexEntryPointsBatchRequest]),
+        ]
+    )
+    rule_runner.write_files(
+        {"src/python/project/app.py": "", "src/python/project/subdir/f2.py": "", "f3.py": ""}
+    )
+
+    def resolve(*entry_points: Tuple[str, str]) -> ResolvedPexEntryPoints:
+        return rule_runner.request(
+            ResolvedPexEntryPoints,
+            [
+                ResolvePexEntryPointsBatchRequest(
+                    ResolvePexEntryPointRequest(PexEntryPointField(ep, Address(spec_path)))
+                    for spec_path, ep in entry_points
+                )
+            ],
+        )
+
+    # Results are returned in the same order as the requests, regardless of scheme.
+    result = resolve(
+        ("src/python/project", "app.py:func"),
+        ("src/python/project", "<none>"),
+        ("src/python/project", "subdir/f2.py"),
+        ("", "custom.entry_point"),
+        ("", "f3.py"),
+        ("src/python/project", "./app.py"),
+    )
+    assert result == ResolvedPexEntryPoints(
+        [
+            ResolvedPexEntryPoint(EntryPoint("project.app", "func"), file_name_used=True),
+            ResolvedPexEntryPoint(None, file_name_used=False),
+            ResolvedPexEntryPoint(EntryPoint("project.subdir.f2"), file_name_used=True),
+            ResolvedPexEntryPoint(EntryPoint("custom.entry_point"), file_name_used=False),
+            ResolvedPexEntryPoint(EntryPoint("f3"), file_name_used=True),
+            ResolvedPexEntryPoint(EntryPoint("project.app"), file_name_used=True),
+        ]
+    )
+
+    def assert_error(bad_entry_point: str, expected: str) -> None:
+        # Any invalid file name is an error, even if the others are fine. The error should only
+        # name the offending target.
+        with pytest.raises(ExecutionError) as exc:
+            rule_runner.request(
+                ResolvedPexEntryPoints,
+                [
+                    ResolvePexEntryPointsBatchRequest(
+                        [
+                            ResolvePexEntryPointRequest(
+                                PexEntryPointField(
+                                    "app.py", Address("src/python/project", target_name="good")
+                                )
+                            ),
+                            ResolvePexEntryPointRequest(
+                                PexEntryPointField(
+                                    bad_entry_point,
+                                    Address("src/python/project", target_name="bad"),
+                                )
+                            ),
+                        ]
+                    )
+                ],
+            )
+        assert expected in str(exc.value)
+        assert "src/python/project:bad" in str(exc.value)
+        assert "src/python/project:good" not in str(exc.value)
+
+    assert_error("doesnt_exist.py", "Unmatched glob")
+    assert_error("**/*.py", "Multiple files matched")
+
+
 def test_inject_pex_binary_entry_point_dependency(caplog) -> None:
     rule_runner = RuleRunner(
         rules=[
             inject_pex_binary_entry_point_dependency,
             resolve_pex_entry_point,
+            resolve_pex_entry_points,
             *import_rules(),
             QueryRule(InjectedDependencies, [InjectPexBinaryEntryPointDependency]),
         ],
@@ -371,6 +450,7 @@ def test_inject_python_distribution_dependencies() -> None:
         rules=[
             inject_python_distribution_dependencies,
             resolve_pex_entry_point,
+            resolve_pex_entry_points,
             resolve_python_distribution_entry_points,
             *import_rules(),
             *python_sources.rules(),
@@ -397,6 +477,7 @@ def test_inject_python_distribution_dependencies() -> None:
         dedent(
             """\
             pex_binary(name="my_binary", entry_point="who_knows.module:main")
+            pex_binary(name="my_other_binary", entry_point="who_knows.module:other")
 
             python_library(name="my_library", sources=["app.py"])
 
@@ -407,6 +488,13 @@ def test_inject_python_distribution_dependencies() -> None:
                 ).with_binaries({"my_cmd": ":my_binary"})
             )
 
+            python_distribution(
+                name="dist-a-mixed",
+                provides=setup_py(
+                    name='my-dist-a-mixed'
+                ).with_binaries({"my_cmd": ":my_binary", "other_cmd": "//project:my_other_binary"})
+            )
+
             python_distribution(
                 name="dist-b",
                 provides=setup_py(
@@ -455,6 +543,14 @@ def test_inject_python_distribution_dependencies() -> None:
         [Address("project", target_name="my_binary")],
     )
 
+    assert_injected(
+        Address("project", target_name="dist-a-mixed"),
+        [
+            Address("project", target_name="my_binary"),
+            Address("project", target_name="my_other_binary"),
+        ],
+    )
+
     assert_injected(
         Address("project", target_name="dist-b"),
         [
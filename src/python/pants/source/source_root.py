@@ -217,10 +217,9 @@ async def get_optional_source_roots(
     }
     dirs.update(file_to_dir.values())
 
-    dir_to_root: Dict[PurePath, OptionalSourceRoot] = {}
-    for d in dirs:
-        root = await Get(OptionalSourceRoot, SourceRootRequest(d))
-        dir_to_root[d] = root
+    sorted_dirs = sorted(dirs)
+    roots = await MultiGet(Get(OptionalSourceRoot, SourceRootRequest(d)) for d in sorted_dirs)
+    dir_to_root: Dict[PurePath, OptionalSourceRoot] = dict(zip(sorted_dirs, roots))
 
     path_to_optional_root: Dict[PurePath, OptionalSourceRoot] = {}
     for d in source_roots_request.dirs: